@@ -25,7 +25,7 @@ can realize in the pendulum mode of motion (i.e. no angular momentum). See
 
 import IPython
 
-from numpy import zeros
+from numpy import array, zeros
 
 import pymanoid
 
@@ -63,7 +63,7 @@ class AccelConeDrawer(pymanoid.Process):
         self.color = color
         self.contact_poses = {}
         self.handle = None
-        self.last_com = stance.com.p
+        self.last_com = array(stance.com.p)
         self.stance = stance
         #
         self.update_contact_poses()
@@ -83,11 +83,11 @@ class AccelConeDrawer(pymanoid.Process):
         if norm(self.stance.com.p - self.last_com) > 1e-10:
             self.update_contact_poses()
             self.update_cone()
-            self.last_com = self.stance.com.p
+            self.last_com = array(self.stance.com.p)
 
     def update_contact_poses(self):
         for contact in self.stance.contacts:
-            self.contact_poses[contact.name] = contact.pose
+            self.contact_poses[contact.name] = array(contact.pose)
 
     def update_cone(self):
         self.handle = None
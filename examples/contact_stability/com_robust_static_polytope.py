@@ -95,7 +95,7 @@ class SupportPolyhedronDrawer(pymanoid.Process):
 
     def update_contacts(self):
         for contact in self.stance.contacts:
-            self.contact_poses[contact.name] = contact.pose
+            self.contact_poses[contact.name] = array(contact.pose)
 
     def create_polyhedron(self, contacts):
         self.handle = None
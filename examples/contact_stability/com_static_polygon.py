@@ -28,6 +28,7 @@ import sys
 
 import pymanoid
 
+from numpy import array
 from pymanoid.gui import StaticEquilibriumWrenchDrawer
 from pymanoid.gui import draw_polygon
 from pymanoid.misc import norm
@@ -82,7 +83,7 @@ class SupportPolygonDrawer(pymanoid.Process):
 
     def update_contact_poses(self):
         for contact in self.stance.contacts:
-            self.contact_poses[contact.name] = contact.pose
+            self.contact_poses[contact.name] = array(contact.pose)
 
     def update_polygon(self):
         self.handle = None
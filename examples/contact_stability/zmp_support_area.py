@@ -24,7 +24,7 @@ stance (contacts and CoM position). See [Caron16]_ for details.
 
 import IPython
 
-from numpy import zeros
+from numpy import array, zeros
 
 import pymanoid
 
@@ -63,7 +63,7 @@ class SupportAreaDrawer(pymanoid.Process):
         self.contact_poses = {}
         self.handle = None
         self.height = height
-        self.last_com = stance.com.p
+        self.last_com = array(stance.com.p)
         self.stance = stance
         #
         self.update_contact_poses()
@@ -74,7 +74,7 @@ class SupportAreaDrawer(pymanoid.Process):
 
     def update_contact_poses(self):
         for contact in self.stance.contacts:
-            self.contact_poses[contact.name] = contact.pose
+            self.contact_poses[contact.name] = array(contact.pose)
 
     def update_height(self, height):
         self.height = height
@@ -101,7 +101,7 @@ class SupportAreaDrawer(pymanoid.Process):
         if norm(self.stance.com.p - self.last_com) > 1e-10:
             self.update_contact_poses()
             self.update_polygon()
-            self.last_com = self.stance.com.p
+            self.last_com = array(self.stance.com.p)
 
 
 class StaticWrenchDrawer(PointMassWrenchDrawer):
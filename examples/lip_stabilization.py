@@ -49,8 +49,8 @@ class Stabilizer(pymanoid.Process):
     def __init__(self, pendulum, gain=2.):
         super(Stabilizer, self).__init__()
         assert gain > 1., "DCM feedback gain needs to be greater than one"
-        self.desired_dcm = pendulum.com.p
-        self.desired_vrp = pendulum.com.p
+        self.desired_dcm = numpy.array(pendulum.com.p)
+        self.desired_vrp = numpy.array(pendulum.com.p)
         self.gain = gain
         self.handles = None
         self.omega = numpy.sqrt(pendulum.lambda_)
@@ -719,7 +719,8 @@ class PreviewDrawer(pymanoid.Process):
         """
         if preview_buffer.is_empty:
             return
-        com_pre, comd_pre = com_target.p, com_target.pd
+        # copy the velocity: `pd` is a read-only view on the target's state
+        com_pre, comd_pre = com_target.p, array(com_target.pd)
         com_free, comd_free = com_target.p, com_target.pd
         self.handles = []
         self.handles.append(
@@ -797,7 +798,7 @@ class TubeDrawer(pymanoid.Process):
 
     def draw_dual(self, tube):
         self.cone_handles = []
-        self.trans = com_target.p
+        self.trans = array(com_target.p)
         apex = [0., 0., self.acc_scale * -9.81] + self.trans
         colors = [(0.5, 0.5, 0., 0.3), (0., 0.5, 0.5, 0.3)]
         if tube.start_stance.label.startswith('SS'):
@@ -18,11 +18,13 @@
 # pymanoid. If not, see <http://www.gnu.org/licenses/>.
 
 from .body import Body
+from .body import BodyPoseStore
 from .body import Box
 from .body import Cube
 from .body import Manipulator
 from .body import Point
 from .body import PointMass
+from .body import PointMassBatch
 from .contact import Contact
 from .contact import ContactFeed
 from .contact import ContactSet
@@ -44,6 +46,7 @@ import robots  # comment out this import when building the docs
 
 __all__ = [
     'Body',
+    'BodyPoseStore',
     'Box',
     'CameraRecorder',
     'Contact',
@@ -56,6 +59,7 @@ __all__ = [
     'Manipulator',
     'Point',
     'PointMass',
+    'PointMassBatch',
     'Process',
     'Robot',
     'Simulation',
@@ -18,12 +18,73 @@
 # pymanoid. If not, see <http://www.gnu.org/licenses/>.
 
 import openravepy
+import weakref
 
-from numpy import array, dot, eye, hstack, ndarray, vstack, zeros
+from math import copysign, cos, sin
+from numpy import array, asarray, dot, empty, eye, hstack, ndarray, vstack
+from numpy import zeros
 
 from .misc import matplotlib_to_rgb, norm
 from .sim import get_openrave_env
-from .transformations import crossmat, rotation_matrix_from_rpy, rpy_from_quat
+from .transformations import crossmat, crossmat_into
+from .transformations import rotation_matrix_from_quat_into
+from .transformations import rotation_matrix_from_rpy_into, rpy_from_quat
+
+
+_cache_stamp = 1  # incremented whenever kinematics change outside Body setters
+
+
+def invalidate_body_caches():
+    """
+    Invalidate the cached transforms of all Body instances.
+
+    Notes
+    -----
+    Bodies cache the last transform read from OpenRAVE to avoid repeated
+    round-trips through the Python bindings (one fresh 4 x 4 array per call).
+    Body setters keep these caches up to date, but transforms can also change
+    behind our back, *e.g.* when robot links move after a call to
+    :func:`pymanoid.robot.Robot.set_dof_values`. Call this function after any
+    such update.
+    """
+    global _cache_stamp
+    _cache_stamp += 1
+
+
+_removal_queue = []  # OpenRAVE bodies of garbage-collected Body instances
+
+
+def _enqueue_removal(rave_body):
+    """Queue an OpenRAVE body for removal at the next flush."""
+    _removal_queue.append(rave_body)
+
+
+def flush_removals():
+    """
+    Remove the OpenRAVE bodies of garbage-collected Body instances.
+
+    Notes
+    -----
+    Removing bodies one by one at garbage-collection time means entering the
+    environment lock from finalizer context, which serializes garbage
+    collection on that lock (and can deadlock at interpreter shutdown when
+    many temporary bodies die at once). Finalizers therefore only queue the
+    underlying OpenRAVE body; this function drains the whole queue within a
+    single environment lock. The simulation loop calls it once per step.
+    """
+    if not _removal_queue:
+        return
+    env = get_openrave_env()
+    with env:
+        while _removal_queue:
+            try:
+                env.Remove(_removal_queue.pop())
+            except Exception:
+                # mirror the former __del__ behavior: Body also wraps
+                # objects that cannot be removed from the environment
+                # (robot links, manipulators), and their failures should
+                # not block the rest of the queue
+                pass
 
 
 class Body(object):
@@ -54,6 +115,11 @@ class Body(object):
                  visible=True):
         self.color = color
         self.rave = rave_body
+        self._T = None
+        self._pose = None
+        self._stamp = 0  # always stale initially
+        self._geometries = None  # lazy cache, see the `geometries` property
+        self._finalizer = weakref.finalize(self, _enqueue_removal, rave_body)
         if not rave_body.GetName():
             self.set_name("%s%s" % (type(self).__name__, Body.count))
             Body.count += 1
@@ -71,6 +137,21 @@ class Body(object):
     def __str__(self):
         return "pymanoid.Body('%s')" % self.name
 
+    @property
+    def geometries(self):
+        """
+        Geometries of all links of the rigid body.
+
+        OpenRAVE's GetLinks and GetGeometries build fresh Python lists at
+        every call (one boundary crossing per link). The link structure of a
+        body doesn't change, so the flattened list is cached at first access.
+        """
+        if self._geometries is None:
+            self._geometries = [
+                geom for link in self.rave.GetLinks()
+                for geom in link.GetGeometries()]
+        return self._geometries
+
     def set_color(self, color):
         """
         Set the color of the rigid body.
@@ -82,10 +163,9 @@ class Body(object):
         """
         if isinstance(color, str):
             color = matplotlib_to_rgb(color)
-        for link in self.rave.GetLinks():
-            for geom in link.GetGeometries():
-                geom.SetAmbientColor(color)
-                geom.SetDiffuseColor(color)
+        for geom in self.geometries:
+            geom.SetAmbientColor(color)
+            geom.SetDiffuseColor(color)
         self.color = color
 
     def set_name(self, name):
@@ -106,9 +186,8 @@ class Body(object):
         transparency : double, optional
             Transparency value from 0 (opaque) to 1 (invisible).
         """
-        for link in self.rave.GetLinks():
-            for geom in link.GetGeometries():
-                geom.SetTransparency(transparency)
+        for geom in self.geometries:
+            geom.SetTransparency(transparency)
 
     def show(self):
         """Make the body visible."""
@@ -134,6 +213,15 @@ class Body(object):
         """Body name."""
         return str(self.rave.GetName())
 
+    def _sync_cache(self):
+        """
+        Drop cached transforms if kinematics changed outside Body setters.
+        """
+        if self._stamp != _cache_stamp:
+            self._T = None
+            self._pose = None
+            self._stamp = _cache_stamp
+
     @property
     def T(self):
         """
@@ -162,8 +250,15 @@ class Body(object):
         homogeneous coordinates of a point in the body frame, then the
         homogeneous coordinates of this point in the world frame are
         :math:`\\tilde{p}_\\mathrm{world} = T \\tilde{p}_\\mathrm{body}`.
+
+        The transform is read from OpenRAVE once and cached until the next
+        setter call (or cache invalidation): don't mutate the returned array
+        without going through :func:`set_transform`.
         """
-        return self.rave.GetTransform()
+        self._sync_cache()
+        if self._T is None:
+            self._T = self.rave.GetTransform()
+        return self._T
 
     @property
     def transform(self):
@@ -205,31 +300,45 @@ class Body(object):
         a quaternion :math:`q = [q_w\\,q_x\\,q_y\\,q_z]` (with the real term
         :math:`q_w` coming first) for the body orientation, followed by the
         coordinates :math:`p = [x\\,y\\,z]` in the world frame.
-        """
-        pose = self.rave.GetTransformPose()
-        if pose[0] < 0:  # convention: cos(alpha) > 0
-            # this convention enforces Slerp shortest path
-            pose[:4] *= -1
-        return pose
+
+        Notes
+        -----
+        Like :func:`T`, the returned array is cached and updated in place by
+        later setter calls: copy it if you want a snapshot, and don't mutate
+        it without going through :func:`set_pose`.
+        """
+        self._sync_cache()
+        if self._pose is None:
+            pose = self.rave.GetTransformPose()
+            # convention: cos(alpha) > 0, which enforces the Slerp shortest
+            # path; the copysign formulation is branchless, so there is no
+            # hemisphere-dependent branch to mispredict
+            pose[:4] *= copysign(1., pose[0])
+            self._pose = pose
+        return self._pose
 
     @property
     def R(self):
-        """Rotation matrix `R` from local to world coordinates."""
+        """Rotation matrix `R` from local to world coordinates (view on the
+        cached transform: copy it if you want a snapshot)."""
         return self.T[0:3, 0:3]
 
     @property
     def rotation_matrix(self):
-        """Rotation matrix `R` from local to world coordinates."""
+        """Rotation matrix `R` from local to world coordinates (view on the
+        cached transform: copy it if you want a snapshot)."""
         return self.R
 
     @property
     def p(self):
-        """Position coordinates `[x y z]` in the world frame."""
+        """Position coordinates `[x y z]` in the world frame (view on the
+        cached transform: copy it if you want a snapshot)."""
         return self.T[0:3, 3]
 
     @property
     def pos(self):
-        """Position coordinates `[x y z]` in the world frame."""
+        """Position coordinates `[x y z]` in the world frame (view on the
+        cached transform: copy it if you want a snapshot)."""
         return self.p
 
     @property
@@ -249,27 +358,32 @@ class Body(object):
 
     @property
     def t(self):
-        """Tangent vector directing the `x`-axis of the body frame."""
+        """Tangent vector directing the `x`-axis of the body frame (view on
+        the cached transform: copy it if you want a snapshot)."""
         return self.T[0:3, 0]
 
     @property
     def b(self):
-        """Binormal vector directing the `y`-axis of the body frame."""
+        """Binormal vector directing the `y`-axis of the body frame (view on
+        the cached transform: copy it if you want a snapshot)."""
         return self.T[0:3, 1]
 
     @property
     def n(self):
-        """Normal vector directing the `z`-axis of the body frame."""
+        """Normal vector directing the `z`-axis of the body frame (view on
+        the cached transform: copy it if you want a snapshot)."""
         return self.T[0:3, 2]
 
     @property
     def normal(self):
-        """Normal vector directing the `z`-axis of the body frame."""
+        """Normal vector directing the `z`-axis of the body frame (view on
+        the cached transform: copy it if you want a snapshot)."""
         return self.T[0:3, 2]
 
     @property
     def quat(self):
-        """Quaternion of the rigid body orientation."""
+        """Quaternion of the rigid body orientation (view on the cached pose:
+        copy it if you want a snapshot)."""
         return self.pose[0:4]
 
     @property
@@ -307,6 +421,38 @@ class Body(object):
             Transform matrix.
         """
         self.rave.SetTransform(T)
+        if self._T is not T:
+            self._T = array(T)
+        self._pose = None
+        self._stamp = _cache_stamp
+
+    @staticmethod
+    def batch_set_transforms(items):
+        """
+        Set the transforms of several bodies within one environment lock.
+
+        Parameters
+        ----------
+        items : list of (Body, array) couples
+            Bodies to update, each with its new transformation matrix.
+
+        Notes
+        -----
+        Every individual transform update acquires the OpenRAVE environment
+        mutex. When many bodies are teleported per tick, e.g. when replaying
+        a trajectory with its contacts and markers, the lock traffic
+        dominates; this batch variant enters the lock once for the whole
+        update. Accumulate (body, transform) couples over the frame and call
+        it once instead of calling :func:`set_transform` per body.
+        """
+        env = get_openrave_env()
+        with env:
+            for body, T in items:
+                body.rave.SetTransform(T)
+                if body._T is not T:
+                    body._T = array(T)
+                body._pose = None
+                body._stamp = _cache_stamp
 
     def set_pos(self, pos):
         """
@@ -317,7 +463,7 @@ class Body(object):
         pos : array, shape=(3,)
             3D vector of position coordinates.
         """
-        T = self.T.copy()
+        T = self.T
         T[:3, 3] = pos
         self.set_transform(T)
 
@@ -333,7 +479,7 @@ class Body(object):
         R : (3, 3) array
             Rotation matrix.
         """
-        T = self.T.copy()
+        T = self.T
         T[:3, :3] = R
         self.set_transform(T)
 
@@ -346,7 +492,7 @@ class Body(object):
         x : scalar
             New `x`-coordinate.
         """
-        T = self.T.copy()
+        T = self.T
         T[0, 3] = x
         self.set_transform(T)
 
@@ -359,7 +505,7 @@ class Body(object):
         y : scalar
             New `y`-coordinate.
         """
-        T = self.T.copy()
+        T = self.T
         T[1, 3] = y
         self.set_transform(T)
 
@@ -372,7 +518,7 @@ class Body(object):
         z : scalar
             New `z`-coordinate.
         """
-        T = self.T.copy()
+        T = self.T
         T[2, 3] = z
         self.set_transform(T)
 
@@ -385,8 +531,8 @@ class Body(object):
         rpy : scalar triplet
             Triplet `(r, p, y)` of roll-pitch-yaw angles.
         """
-        T = self.T.copy()
-        T[0:3, 0:3] = rotation_matrix_from_rpy(rpy)
+        T = self.T
+        rotation_matrix_from_rpy_into(asarray(rpy, dtype=float), T[0:3, 0:3])
         self.set_transform(T)
 
     def set_roll(self, roll):
@@ -431,8 +577,14 @@ class Body(object):
         pose : (7,) array
             Pose of the body, i.e. quaternion + position in world frame.
         """
-        T = openravepy.matrixFromPose(pose)
+        pose = array(pose, dtype=float)  # private copy, also feeds the cache
+        T = self.T
+        rotation_matrix_from_quat_into(pose, T[:3, :3])
+        T[:3, 3] = pose[4:7]
         self.set_transform(T)
+        # cache follows the `pose` convention: unit quaternion with qw >= 0
+        pose[:4] *= copysign(1., pose[0]) / norm(pose[:4])
+        self._pose = pose
 
     def set_quat(self, quat):
         """
@@ -443,9 +595,16 @@ class Body(object):
         quat : (4,) array
             Quaternion in (w, x, y, z) format.
         """
-        pose = self.pose.copy()
-        pose[0:4] = quat
-        self.set_pose(pose)
+        quat = asarray(quat, dtype=float)
+        T = self.T  # refreshes the cache, so _pose is either None or valid
+        rotation_matrix_from_quat_into(quat, T[:3, :3])
+        self.rave.SetTransform(T)
+        pose = self._pose
+        if pose is not None:
+            # translation is unchanged: update the quaternion in place
+            # instead of invalidating the whole cached pose
+            pose[:4] = quat
+            pose[:4] *= copysign(1., quat[0]) / norm(quat)
 
     def translate(self, translation):
         """
@@ -462,19 +621,11 @@ class Body(object):
         """
         Remove body from OpenRAVE environment.
         """
+        self._finalizer.detach()  # this removal supersedes the queued one
         env = get_openrave_env()
         with env:
             env.Remove(self.rave)
 
-    def __del__(self):
-        """
-        Add body removal to garbage collection step (effective).
-        """
-        try:
-            self.remove()
-        except Exception:  # __del__ exceptions are ignored
-            pass
-
     def apply_twist(self, v, omega, dt):
         """
         Apply a twist :math:`[v\\ \\omega]` defined in the local coordinate
@@ -488,9 +639,35 @@ class Body(object):
             Angular velocity in local frame.
         dt : scalar
             Duration of twist application in [s].
-        """
-        self.set_pos(self.p + v * dt)
-        self.set_rotation_matrix(self.R + dot(crossmat(omega), self.R) * dt)
+
+        Notes
+        -----
+        The rotation update applies `Rodrigues' rotation formula
+        <https://en.wikipedia.org/wiki/Rodrigues%27_rotation_formula>`_, so
+        that the new rotation matrix stays in SO(3) (a first-order Euler
+        update would not), and the whole twist is shipped to OpenRAVE in a
+        single transform update.
+        """
+        Omega = omega * dt
+        theta = norm(Omega)
+        T = self.T
+        R = T[:3, :3]
+        if theta < 1e-10:
+            # first-order update R += crossmat(Omega) * R, with the rows of
+            # the product written out explicitly: for a 3 x 3 product, BLAS
+            # dispatch costs more than the six multiplications per row
+            wx, wy, wz = Omega[0], Omega[1], Omega[2]
+            r0 = R[0] + wy * R[2] - wz * R[1]
+            r1 = R[1] + wz * R[0] - wx * R[2]
+            r2 = R[2] + wx * R[1] - wy * R[0]
+            R[0], R[1], R[2] = r0, r1, r2
+        else:  # Rodrigues' rotation formula
+            K = crossmat_into(Omega, empty((3, 3)))
+            R_delta = eye(3) + sin(theta) / theta * K \
+                + (1. - cos(theta)) / theta ** 2 * dot(K, K)
+            T[:3, :3] = dot(R_delta, R)
+        T[:3, 3] += v * dt
+        self.set_transform(T)
 
     def dist(self, point):
         """
@@ -528,6 +705,100 @@ class Body(object):
             hstack([dot(crossmat(self.p), self.R), self.R])])
 
 
+class BodyPoseStore(object):
+
+    """
+    Contiguous structure-of-arrays store for the poses of a set of bodies.
+
+    Reading or updating the poses of `N` bodies one at a time costs `N`
+    OpenRAVE round-trips, each returning a separate heap-allocated array. A
+    pose store keeps all registered poses in a single `N x 7` array: per-body
+    reads and writes are plain row accesses, and updates are pushed to
+    OpenRAVE in one batch under a single environment lock.
+
+    Parameters
+    ----------
+    capacity : integer, optional
+        Number of rows initially reserved; the store grows as needed.
+    """
+
+    def __init__(self, capacity=64):
+        self.bodies = []
+        self.poses = zeros((capacity, 7))
+        self.__dirty = set()
+
+    def add(self, body):
+        """
+        Register a body in the store.
+
+        Parameters
+        ----------
+        body : Body
+            Body whose pose will be tracked by the store.
+
+        Returns
+        -------
+        row : integer
+            Row index of the body in the pose array.
+        """
+        row = len(self.bodies)
+        if row >= self.poses.shape[0]:  # grow by doubling
+            poses = zeros((2 * self.poses.shape[0], 7))
+            poses[:row] = self.poses
+            self.poses = poses
+        self.bodies.append(body)
+        self.poses[row] = body.pose
+        return row
+
+    def pose(self, row):
+        """
+        Pose of a registered body, read from the store.
+
+        Parameters
+        ----------
+        row : integer
+            Row index returned by :func:`add`.
+
+        Returns
+        -------
+        pose : (7,) array
+            Row of the pose array (a view, not a copy).
+        """
+        return self.poses[row]
+
+    def set_pose(self, row, pose):
+        """
+        Update the pose of a registered body.
+
+        The update is only written to the store; call :func:`flush` to push
+        pending updates to OpenRAVE.
+
+        Parameters
+        ----------
+        row : integer
+            Row index returned by :func:`add`.
+        pose : (7,) array
+            New pose of the body.
+        """
+        self.poses[row] = pose
+        self.__dirty.add(row)
+
+    def flush(self):
+        """
+        Push all pending pose updates to OpenRAVE.
+
+        All updates are applied within a single environment lock, so the cost
+        of acquiring it is amortized over the whole batch.
+        """
+        if not self.__dirty:
+            return
+        env = get_openrave_env()
+        with env:
+            for row in self.__dirty:
+                self.bodies[row].set_pose(self.poses[row])
+        self.__dirty.clear()
+
+
 class Manipulator(Body):
 
     """
@@ -647,11 +918,11 @@ class Box(Body):
 
     def __init__(self, X, Y, Z, pos=None, rpy=None, pose=None, color='r',
                  visible=True, dZ=0.):
-        aabb = [0., 0., dZ, X, Y, Z]
+        aabb = array([[0., 0., dZ, X, Y, Z]])
         env = get_openrave_env()
         with env:
             box = openravepy.RaveCreateKinBody(env, '')
-            box.InitFromBoxes(array([array(aabb)]), True)
+            box.InitFromBoxes(aabb, True)
             super(Box, self).__init__(
                 box, pos=pos, rpy=rpy, pose=pose, color=color, visible=visible)
             env.Add(box, True)
@@ -710,8 +981,10 @@ class Point(Cube):
                  visible=True):
         super(Point, self).__init__(
             size, pos=pos, color=color, visible=visible)
-        self.__pd = zeros(3) if vel is None else array(vel)
-        self.__pdd = zeros(3) if accel is None else array(accel)
+        self.__pd = zeros(3) if vel is None else array(vel, dtype=float)
+        self.__pdd = zeros(3) if accel is None else array(accel, dtype=float)
+        self.__pd_view = self.__pd.view()
+        self.__pd_view.flags.writeable = False
 
     def copy(self, color='r', visible=True):
         """
@@ -728,8 +1001,15 @@ class Point(Cube):
 
     @property
     def pd(self):
-        """Point velocity."""
-        return self.__pd.copy()
+        """
+        Point velocity.
+
+        This property used to return a defensive copy, costing one allocation
+        per access (and simulation loops access it at every time step). It now
+        returns a read-only view on the internal velocity vector; use
+        :func:`set_vel` to update it.
+        """
+        return self.__pd_view
 
     @property
     def xd(self):
@@ -755,7 +1035,7 @@ class Point(Cube):
         pd : array, shape=(3,)
             Velocity coordinates in the world frame.
         """
-        self.__pd = array(pd)
+        self.__pd[:] = pd  # in place, so that views on it stay valid
 
     @property
     def pdd(self):
@@ -786,7 +1066,7 @@ class Point(Cube):
         pdd : array, shape=(3,)
             Acceleration coordinates in the world frame.
         """
-        self.__pdd = array(pdd)
+        self.__pdd[:] = pdd  # in place, so that the buffer stays float
 
     def integrate_constant_accel(self, pdd, dt):
         """
@@ -798,10 +1078,19 @@ class Point(Cube):
             Point acceleration in the world frame.
         dt : scalar
             Duration in [s].
-        """
-        self.set_pos(self.p + (self.pd + .5 * pdd * dt) * dt)
-        self.set_vel(self.pd + pdd * dt)
-        self.set_accel(pdd)
+
+        Notes
+        -----
+        This update is fused: position, velocity and acceleration are written
+        in place in the cached state, and the new transform is shipped to
+        OpenRAVE exactly once.
+        """
+        T = self.T
+        pd = self.__pd
+        T[:3, 3] += (pd + .5 * pdd * dt) * dt
+        pd += pdd * dt
+        self.__pdd[:] = pdd
+        self.set_transform(T)
 
     def integrate_constant_jerk(self, pddd, dt):
         """
@@ -867,3 +1156,72 @@ class PointMass(Point):
     def momentum(self):
         """Linear momentum in the world frame."""
         return self.mass * self.pd
+
+
+class PointMassBatch(object):
+
+    """
+    Structure-of-arrays batch of point masses.
+
+    Each :class:`pymanoid.body.PointMass` keeps its state behind an OpenRAVE
+    transform, so aggregate computations over many point masses (center of
+    mass, momentum) stride over separately-allocated transforms from Python.
+    A batch stores masses, positions and velocities in contiguous arrays,
+    reducing aggregates and integration steps to single NumPy operations
+    vectorized over the whole batch.
+
+    Parameters
+    ----------
+    masses : (N,) array
+        Mass of each point in [kg].
+    positions : (N, 3) array
+        Initial positions in the world frame.
+    velocities : (N, 3) array, optional
+        Initial velocities in the world frame.
+    """
+
+    def __init__(self, masses, positions, velocities=None):
+        positions = array(positions, dtype=float)
+        self.masses = array(masses, dtype=float)
+        self.positions = positions
+        self.total_mass = self.masses.sum()
+        self.velocities = zeros(positions.shape) if velocities is None \
+            else array(velocities, dtype=float)
+
+    @property
+    def com(self):
+        """Center of mass of the batch, in the world frame."""
+        return dot(self.masses, self.positions) / self.total_mass
+
+    @property
+    def momentum(self):
+        """Total linear momentum in the world frame."""
+        return dot(self.masses, self.velocities)
+
+    def integrate_constant_accel(self, pdd, dt):
+        """
+        Apply Euler integration to all points for constant accelerations.
+
+        Parameters
+        ----------
+        pdd : (N, 3) array
+            Point accelerations in the world frame.
+        dt : scalar
+            Duration in [s].
+        """
+        self.positions += (self.velocities + .5 * pdd * dt) * dt
+        self.velocities += pdd * dt
+
+    def sync_bodies(self, bodies):
+        """
+        Push batch positions to display bodies in one environment lock.
+
+        Parameters
+        ----------
+        bodies : list of Body
+            Bodies to update, one per point in the batch.
+        """
+        env = get_openrave_env()
+        with env:
+            for body, pos in zip(bodies, self.positions):
+                body.set_pos(pos)
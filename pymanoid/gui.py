@@ -698,7 +698,7 @@ class TrajectoryDrawer(Process):
         self.color = color
         self.handles = [None] * buffer_size
         self.next_index = 0
-        self.last_pos = body.p
+        self.last_pos = array(body.p)
         self.linestyle = linestyle
         self.linewidth = linewidth
 
@@ -711,7 +711,7 @@ class TrajectoryDrawer(Process):
                 self.last_pos, self.body.p, color=self.color,
                 linewidth=self.linewidth)
             self.next_index = (self.next_index + 1) % self.buffer_size
-        self.last_pos = self.body.p
+        self.last_pos = array(self.body.p)
 
     def dash_graph_handles(self):
         for i in range(len(self.handles)):
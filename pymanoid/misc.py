@@ -184,6 +184,21 @@ def info(msg):
     print("%c[0;%d;48m%s pymanoid [INFO] %s%c[m" % (0x1B, 32, now, msg, 0x1B))
 
 
+# Palette precomputed at import time: color-code lookups in matplotlib_to_rgb
+# then take a single dict access rather than a cascade of branches and list
+# allocations.
+_RGB_FROM_MPL = {
+    'b': [0., 0., .5],
+    'c': [0., .5, .5],
+    'g': [0., .5, 0.],
+    'k': [0., 0., 0.],
+    'm': [.5, 0., .5],
+    'r': [.5, 0., 0.],
+    'w': [1., 1., 1.],
+    'y': [.5, .5, 0.],
+}
+
+
 def matplotlib_to_rgb(color):
     """
     Convert matplotlib color string to RGB tuple.
@@ -196,20 +211,10 @@ def matplotlib_to_rgb(color):
     Returns
     -------
     rgb : tuple
-        Red-green-blue tuple with values between 0 and 1.
+        Red-green-blue tuple with values between 0 and 1. The returned list
+        is shared between calls: don't mutate it.
     """
-    acolor = [0., 0., 0.]
-    if color == 'k':
-        return acolor
-    if color == 'w':
-        return [1., 1., 1.]
-    if color in ['r', 'm', 'y', 'w']:
-        acolor[0] += 0.5
-    if color in ['g', 'y', 'c', 'w']:
-        acolor[1] += 0.5
-    if color in ['b', 'c', 'm', 'w']:
-        acolor[2] += 0.5
-    return acolor
+    return _RGB_FROM_MPL.get(color, _RGB_FROM_MPL['k'])
 
 
 def matplotlib_to_rgba(color, alpha=0.5):
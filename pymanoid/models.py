@@ -17,7 +17,7 @@
 # You should have received a copy of the GNU General Public License along with
 # pymanoid. If not, see <http://www.gnu.org/licenses/>.
 
-from numpy import cosh, dot, sinh, sqrt
+from numpy import array, cosh, dot, sinh, sqrt
 
 from .body import Point
 from .gui import draw_line, draw_point
@@ -60,7 +60,7 @@ class InvertedPendulum(Process):
         self.color = color
         self.com = com
         self.contact = contact
-        self.cop = contact.p
+        self.cop = array(contact.p)
         self.handles = None
         self.is_visible = visible
         self.lambda_ = -gravity[2] / (com.z - contact.z)
@@ -22,7 +22,7 @@ from numpy import concatenate, maximum, minimum
 from os.path import basename, isfile, splitext
 from warnings import warn
 
-from .body import Body, PointMass
+from .body import Body, PointMass, invalidate_body_caches
 from .gui import draw_line, draw_point
 from .ik import IKSolver
 from .misc import matplotlib_to_rgb, middot
@@ -274,6 +274,7 @@ class Robot(object):
         """
         if clamp:
             q = minimum(maximum(self.q_min, q), self.q_max)
+        invalidate_body_caches()  # link transforms are about to change
         if dof_indices is not None:
             return self.rave.SetDOFValues(q, dof_indices)
         return self.rave.SetDOFValues(q)
@@ -146,8 +146,10 @@ class Simulation(object):
         n : int, optional
             Number of simulation steps.
         """
+        from .body import flush_removals  # module-level import is circular
         for _ in range(n):
             t0 = time()
+            flush_removals()
             self._tick_processes()
             rem_time = self.dt - (time() - t0)
             if __debug__ and self.watch_comp_times and rem_time < 0.:
@@ -17,7 +17,9 @@
 # You should have received a copy of the GNU General Public License along with
 # pymanoid. If not, see <http://www.gnu.org/licenses/>.
 
-from numpy import array, dot, eye, hstack, ones, zeros
+from functools import partial
+
+from numpy import array, dot, eye, hstack, ones, subtract, zeros
 
 from .misc import PointWrap, PoseWrap
 
@@ -25,6 +27,16 @@ from .misc import PointWrap, PoseWrap
 _OPPOSE_QUAT = array([-1., -1., -1., -1., +1., +1., +1.])
 
 
+def _pos_residual_body(target, link, dt):
+    """Position residual for a moving target with a ``p`` field."""
+    return (target.p - link.p) / dt
+
+
+def _pos_residual_const(target_p, link, dt):
+    """Position residual for a constant target position."""
+    return (target_p - link.p) / dt
+
+
 class Task(object):
 
     """
@@ -287,9 +299,6 @@ class PosTask(Task):
     def _jacobian(self):
         return self.robot.compute_link_pos_jacobian(self.link)
 
-    def _residual(self, dt):
-        return (self.target.p - self.link.p) / dt
-
     def update_target(self, target):
         """
         Update the task residual with a new target.
@@ -298,8 +307,21 @@ class PosTask(Task):
         ----------
         target : Point or array or list
             New link position target.
+
+        Notes
+        -----
+        The residual function is specialized here, once per target update,
+        so that the per-iteration call is branchless: constant targets bind
+        their coordinates directly rather than going through an attribute
+        lookup at each IK step.
         """
         self.target = target if hasattr(target, 'p') else PointWrap(target)
+        if isinstance(self.target, PointWrap):
+            self._residual = partial(
+                _pos_residual_const, self.target.p, self.link)
+        else:  # target is a moving Body or Point
+            self._residual = partial(
+                _pos_residual_body, self.target, self.link)
 
 
 class PoseTask(Task):
@@ -328,6 +350,7 @@ class PoseTask(Task):
         super(PoseTask, self).__init__(weight, gain, exclude_dofs)
         if type(link) is str:
             link = robot.__getattribute__(link)
+        self.__residual_buf = zeros(7)
         self.link = link
         self.name = self.link.name
         self.robot = robot
@@ -336,11 +359,22 @@ class PoseTask(Task):
     def _jacobian(self):
         return self.robot.compute_link_pose_jacobian(self.link)
 
-    def _residual(self, dt):
-        pose_diff = self.target.pose - self.link.pose
-        if dot(pose_diff[0:4], pose_diff[0:4]) > 1.:
-            pose_diff = _OPPOSE_QUAT * self.target.pose - self.link.pose
-        return pose_diff / dt
+    def __pose_residual(self, target_pose, target_flipped, dt):
+        link_pose = self.link.pose
+        residual = self.__residual_buf
+        if dot(target_pose[0:4], link_pose[0:4]) < 0.:
+            # flip the target quaternion to the same hemisphere as the
+            # link's, so that the residual follows the Slerp shortest path
+            if target_flipped is None:  # moving target, flip lazily
+                target_flipped = _OPPOSE_QUAT * target_pose
+            subtract(target_flipped, link_pose, out=residual)
+        else:
+            subtract(target_pose, link_pose, out=residual)
+        residual /= dt
+        return residual
+
+    def __body_residual(self, dt):
+        return self.__pose_residual(self.target.pose, None, dt)
 
     def update_target(self, target):
         """
@@ -350,8 +384,24 @@ class PoseTask(Task):
         ----------
         target : Point or array or list
             New link position target.
+
+        Notes
+        -----
+        As in :func:`pymanoid.tasks.PosTask.update_target`, the residual
+        function is specialized once per target update: constant targets
+        bind their pose directly so that the per-iteration call skips the
+        attribute lookup.
         """
         self.target = target if hasattr(target, 'pose') else PoseWrap(target)
+        if isinstance(self.target, PoseWrap):
+            # the flipped pose is loop-invariant: precompute it rather than
+            # multiplying by _OPPOSE_QUAT at each IK iteration
+            target_pose = self.target.pose
+            self._residual = partial(
+                self.__pose_residual, target_pose,
+                _OPPOSE_QUAT * target_pose)
+        else:  # target is a moving Body
+            self._residual = self.__body_residual
 
 
 class MinAccelTask(Task):
@@ -38,8 +38,13 @@ Functions are provided to convert between all these representations. Most of
 them are adapted from the comprehensive guide [Diebel06]_.
 """
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional, kernels then run in pure Python
+    njit = None
+
 from math import asin, atan2, cos, sin
-from numpy import array, cross, dot, eye, hstack, zeros
+from numpy import array, asarray, cross, dot, empty, eye, hstack, zeros
 from openravepy import quatFromRotationMatrix as __quatFromRotationMatrix
 from openravepy import rotationMatrixFromQuat as __rotationMatrixFromQuat
 from openravepy import axisAngleFromQuat as axis_angle_from_quat
@@ -103,6 +108,34 @@ def crossmat(x):
         [-x[1], x[0], 0.]])
 
 
+def crossmat_into(x, out):
+    """
+    Write the cross-product matrix of a 3D vector into ``out``.
+
+    Parameters
+    ----------
+    x : (3,) array
+        Vector on the left-hand side of the cross product.
+    out : (3, 3) array
+        Array (or view) the cross-product matrix is written into.
+
+    Returns
+    -------
+    out : (3, 3) array
+        The ``out`` argument.
+    """
+    out[0, 0] = 0.
+    out[0, 1] = -x[2]
+    out[0, 2] = x[1]
+    out[1, 0] = x[2]
+    out[1, 1] = 0.
+    out[1, 2] = -x[0]
+    out[2, 0] = -x[1]
+    out[2, 1] = x[0]
+    out[2, 2] = 0.
+    return out
+
+
 def integrate_angular_acceleration(R, omega, omegad, dt):
     """
     Integrate constant angular acceleration :math:`\\dot{\\omega}` for a
@@ -297,6 +330,46 @@ def rotation_matrix_from_quat(quat):
     return __rotationMatrixFromQuat(quat)
 
 
+def rotation_matrix_from_quat_into(quat, out):
+    """
+    Write the rotation matrix of a quaternion into ``out``.
+
+    Parameters
+    ----------
+    quat : (4,) array
+        Quaternion in `[w x y z]` format.
+    out : (3, 3) array
+        Array (or view) the rotation matrix is written into.
+
+    Returns
+    -------
+    out : (3, 3) array
+        The ``out`` argument.
+
+    Notes
+    -----
+    This in-place variant keeps the conversion in pure Python rather than
+    crossing into the OpenRAVE bindings, and spares the allocation of an
+    intermediate 3 x 3 array. The scaling factor ``s`` makes the formula
+    exact for non-unit quaternions as well.
+    """
+    w, x, y, z = quat[0], quat[1], quat[2], quat[3]
+    s = 2. / (w * w + x * x + y * y + z * z)
+    xx, yy, zz = s * x * x, s * y * y, s * z * z
+    xy, xz, yz = s * x * y, s * x * z, s * y * z
+    wx, wy, wz = s * w * x, s * w * y, s * w * z
+    out[0, 0] = 1. - yy - zz
+    out[0, 1] = xy - wz
+    out[0, 2] = xz + wy
+    out[1, 0] = xy + wz
+    out[1, 1] = 1. - xx - zz
+    out[1, 2] = yz - wx
+    out[2, 0] = xz - wy
+    out[2, 1] = yz + wx
+    out[2, 2] = 1. - xx - yy
+    return out
+
+
 def rotation_matrix_from_rpy(rpy):
     """
     Rotation matrix from roll-pitch-yaw angles.
@@ -311,7 +384,53 @@ def rotation_matrix_from_rpy(rpy):
     R : (3, 3) array
         Rotation matrix.
     """
-    return rotation_matrix_from_quat(quat_from_rpy(rpy))
+    return rotation_matrix_from_rpy_into(
+        asarray(rpy, dtype=float), empty((3, 3)))
+
+
+def rotation_matrix_from_rpy_into(rpy, out):
+    """
+    Write the rotation matrix of roll-pitch-yaw angles into ``out``.
+
+    Parameters
+    ----------
+    rpy : (3,) array
+        Vector of roll-pitch-yaw angles in [rad].
+    out : (3, 3) array
+        Array (or view) the rotation matrix is written into.
+
+    Returns
+    -------
+    out : (3, 3) array
+        The ``out`` argument.
+
+    Notes
+    -----
+    This in-place variant lets callers update e.g. the rotation block of a
+    transformation matrix without allocating an intermediate 3 x 3 array.
+    """
+    cr, cp, cy = cos(rpy[0]), cos(rpy[1]), cos(rpy[2])
+    sr, sp, sy = sin(rpy[0]), sin(rpy[1]), sin(rpy[2])
+    out[0, 0] = cy * cp
+    out[0, 1] = cy * sp * sr - sy * cr
+    out[0, 2] = cy * sp * cr + sy * sr
+    out[1, 0] = sy * cp
+    out[1, 1] = sy * sp * sr + cy * cr
+    out[1, 2] = sy * sp * cr - cy * sr
+    out[2, 0] = -sp
+    out[2, 1] = cp * sr
+    out[2, 2] = cp * cr
+    return out
+
+
+if njit is not None:
+    # These kernels are pure scalar loads and stores, which Numba compiles
+    # well; callers should hand them float arrays rather than lists.
+    crossmat_into = njit(cache=True, fastmath=True)(crossmat_into)
+    rotation_matrix_from_quat_into = njit(cache=True, fastmath=True)(
+        rotation_matrix_from_quat_into)
+    rotation_matrix_from_rpy_into = njit(cache=True, fastmath=True)(
+        rotation_matrix_from_rpy_into)
 
 
 def rpy_from_quat(quat):
@@ -434,6 +553,7 @@ __all__ = [
     'apply_transform',
     'axis_angle_from_quat',
     'crossmat',
+    'crossmat_into',
     'integrate_angular_acceleration',
     'integrate_body_acceleration',
     'magnus_expansion',
@@ -441,7 +561,9 @@ __all__ = [
     'quat_from_rotation_matrix',
     'quat_from_rpy',
     'rotation_matrix_from_quat',
+    'rotation_matrix_from_quat_into',
     'rotation_matrix_from_rpy',
+    'rotation_matrix_from_rpy_into',
     'rpy_from_quat',
     'rpy_from_rotation_matrix',
     'transform_from_pose',